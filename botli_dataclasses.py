@@ -1,3 +1,4 @@
+import sys
 from asyncio import Task
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
@@ -89,7 +90,7 @@ class Chat_Message:
     def from_chatLine_event(cls, chatLine_event: dict[str, Any]) -> 'Chat_Message':
         username = chatLine_event['username']
         text = chatLine_event['text']
-        room = chatLine_event['room']
+        room = sys.intern(chatLine_event['room'])
 
         return cls(username, text, room)
 
@@ -1,8 +1,10 @@
 # ... [imports and class definition as before] ...
 import os
 import platform
-from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from functools import cached_property, lru_cache
 import random
+import re
 import psutil
 import asyncio
 
@@ -12,7 +14,77 @@ from config import Config
 from lichess_game import Lichess_Game
 
 
+_WHITESPACE_REGEX = re.compile(r'\s+')
+
+_ROASTS: tuple[str, ...] = (
+    "You play like your pieces are allergic to the center.",
+    "Your strategy is so deep, it hasn't surfaced yet.",
+    "I’ve seen pawns with more ambition than your whole army.",
+    "You're like a blunder wrapped in an inaccuracy.",
+    "Even Stockfish ran out of evals trying to explain your moves.",
+    "You treat the king like a tourist — always wandering.",
+    "You play like your mouse is on strike.",
+)
+
+_DESTROYS: tuple[str, ...] = (
+    "I’m not just winning — I’m rewriting your opening book in real time.",
+    "This isn’t a game anymore. It’s a live demo of how to dismantle a player.",
+    "You're not losing, you're being systematically erased.",
+    "Your board is starting to look like a clearance sale — everything must go!",
+    "If this were a movie, you'd already be rolling the credits.",
+    "You brought a pawn to a queen fight.",
+    "This isn't just checkmate — it's checkmate with style.",
+)
+
+_QUOTES: tuple[str, ...] = (
+    "“In life, as in chess, forethought wins.” – Charles Buxton",
+    "“Even a poor plan is better than no plan at all.” – Mikhail Chigorin",
+    "“Every master was once a beginner.”",
+    "“Play the opening like a book, the middlegame like a magician, and the endgame like a machine.” – Rudolf Spielmann",
+    "“The blunders are all there on the board, waiting to be made.” – Savielly Tartakower",
+    "“You must take your opponent into a deep dark forest where 2+2=5, and the path leading out is only wide enough for one.” – Tal",
+    "“Great moves often come from great pain.”",
+    "“The beauty of a move lies not in its appearance but in the thought behind it.” – Aaron Nimzowitsch",
+)
+
+
+class _Format_Mapping(dict[str, str]):
+    def __missing__(self, key: str) -> str:
+        return ''
+
+
+@lru_cache(maxsize=1)
+def _get_cpu() -> str:
+    cpu = ''
+    if os.path.exists('/proc/cpuinfo'):
+        with open('/proc/cpuinfo', encoding='utf-8') as cpuinfo:
+            data = cpuinfo.read(4096)
+        if (start := data.find('model name')) != -1:
+            line = data[start:].partition('\n')[0]
+            cpu = line.partition(': ')[2]
+            cpu = cpu.replace('(R)', '').replace('(TM)', '')
+            if len(cpu.split()) > 1:
+                return cpu
+    if processor := platform.processor():
+        cpu = processor.split()[0].replace('GenuineIntel', 'Intel')
+    cores = psutil.cpu_count(logical=False)
+    threads = psutil.cpu_count(logical=True)
+    cpu_freq = psutil.cpu_freq().max / 1000
+    return f'{cpu} {cores}c/{threads}t @ {cpu_freq:.2f}GHz'
+
+
+@lru_cache(maxsize=1)
+def _get_ram() -> str:
+    mem_bytes = psutil.virtual_memory().total
+    mem_gib = mem_bytes / (1024.**3)
+    return f'{mem_gib:.1f} GiB'
+
+
 class Chatter:
+    _HELP_PLAYER = 'Supported commands: !cpu, !draw, !eval, !motor, !name, !printeval, !ram, !roast, !destroy, !quotes'
+    _HELP_SPECTATOR = ('Supported commands: !cpu, !draw, !eval, !motor, !name, !printeval, !pv, !ram, !roast, '
+                       '!destroy, !quotes')
+
     def __init__(self,
                  api: API,
                  config: Config,
@@ -21,18 +93,22 @@ class Chatter:
                  lichess_game: Lichess_Game
                  ) -> None:
         self.api = api
+        self.config = config
         self.username = username
         self.game_info = game_information
         self.lichess_game = lichess_game
-        self.cpu_message = self._get_cpu()
-        self.draw_message = self._get_draw_message(config)
-        self.name_message = self._get_name_message(config.version)
-        self.ram_message = self._get_ram()
+        self.cpu_message = _get_cpu()
+        self.ram_message = _get_ram()
+        opponent_username = self.game_info.black_name if self.lichess_game.is_white else self.game_info.white_name
+        self._format_mapping = _Format_Mapping({'opponent': opponent_username, 'me': self.username,
+                                                'engine': self.lichess_game.engine.name, 'cpu': self.cpu_message,
+                                                'ram': self.ram_message})
         self.player_greeting = self._format_message(config.messages.greeting)
         self.player_goodbye = self._format_message(config.messages.goodbye)
         self.spectator_greeting = self._format_message(config.messages.greeting_spectators)
         self.spectator_goodbye = self._format_message(config.messages.goodbye_spectators)
         self.print_eval_rooms: set[str] = set()
+        self._rng = random.Random()
 
     async def handle_chat_message(self, chatLine_Event: dict) -> None:
         chat_message = Chat_Message.from_chatLine_event(chatLine_Event)
@@ -44,9 +120,12 @@ class Chatter:
 
         if chat_message.username != self.username:
             prefix = f'{chat_message.username} ({chat_message.room}): '
-            output = prefix + chat_message.text
-            if len(output) > 128:
-                output = f'{output[:128]}\n{len(prefix) * " "}{output[128:]}'
+            text = chat_message.text
+            if len(prefix) + len(text) > 128:
+                head_len = 128 - len(prefix)
+                output = f'{prefix}{text[:head_len]}\n{len(prefix) * " "}{text[head_len:]}'
+            else:
+                output = prefix + text
 
             print(output)
 
@@ -54,185 +133,171 @@ class Chatter:
             await self._handle_command(chat_message)
 
     async def print_eval(self) -> None:
+        if not self.print_eval_rooms:
+            return
+
         if not self.game_info.increment_ms and self.lichess_game.own_time < 30.0:
             return
 
-        for room in self.print_eval_rooms:
-            await self._send_last_message(room)
+        rooms = tuple(self.print_eval_rooms)
+        await asyncio.gather(*(self._send_last_message(room) for room in rooms))
 
     async def send_greetings(self) -> None:
-        if self.player_greeting:
-            await self.api.send_chat_message(self.game_info.id_, 'player', self.player_greeting)
-
-        if self.spectator_greeting:
-            await self.api.send_chat_message(self.game_info.id_, 'spectator', self.spectator_greeting)
+        await self._send_room_messages(self.player_greeting, self.spectator_greeting)
 
     async def send_goodbyes(self) -> None:
         if self.lichess_game.is_abortable:
             return
 
-        if self.player_goodbye:
-            await self.api.send_chat_message(self.game_info.id_, 'player', self.player_goodbye)
+        await self._send_room_messages(self.player_goodbye, self.spectator_goodbye)
+
+    async def _send_room_messages(self, player_message: str | None, spectator_message: str | None) -> None:
+        coros = []
+        if player_message:
+            coros.append(self.api.send_chat_message(self.game_info.id_, 'player', player_message))
 
-        if self.spectator_goodbye:
-            await self.api.send_chat_message(self.game_info.id_, 'spectator', self.spectator_goodbye)
+        if spectator_message:
+            coros.append(self.api.send_chat_message(self.game_info.id_, 'spectator', spectator_message))
+
+        await asyncio.gather(*coros)
 
     async def _handle_command(self, chat_message: Chat_Message) -> None:
-        match chat_message.text[1:].lower():
-            case 'cpu':
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.cpu_message)
-            case 'draw':
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.draw_message)
-            case 'eval':
-                await self._send_last_message(chat_message.room)
-            case 'motor':
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.lichess_game.engine.name)
-            case 'name':
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.name_message)
-            case 'printeval':
-                if not self.game_info.increment_ms and self.game_info.initial_time_ms < 180_000:
-                    await self._send_last_message(chat_message.room)
-                    return
-                if chat_message.room in self.print_eval_rooms:
-                    return
-                self.print_eval_rooms.add(chat_message.room)
-                await self.api.send_chat_message(self.game_info.id_,
-                                                 chat_message.room,
-                                                 'Type !quiet to stop eval printing.')
-                await self._send_last_message(chat_message.room)
-            case 'quiet':
-                self.print_eval_rooms.discard(chat_message.room)
-            case 'pv':
-                if chat_message.room == 'player':
-                    return
-                if not (message := self._append_pv()):
-                    message = 'No modules available.'
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, message)
-            case 'ram':
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.ram_message)
-            case 'roast':
-                roast = self._get_random_roast()
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, roast)
-            case 'destroy' | 'troll':
-                destroy = self._get_random_destroy()
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, destroy)
-            case 'quotes':
-                quote = self._get_random_quote()
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, quote)
-            case 'help' | 'commands':
-                if chat_message.room == 'player':
-                    message = 'Supported commands: !cpu, !draw, !eval, !motor, !name, !printeval, !ram, !roast, !destroy, !quotes'
-                else:
-                    message = 'Supported commands: !cpu, !draw, !eval, !motor, !name, !printeval, !pv, !ram, !roast, !destroy, !quotes'
-                await self.api.send_chat_message(self.game_info.id_, chat_message.room, message)
+        if handler := self._COMMAND_TABLE.get(chat_message.text[1:].lower()):
+            await handler(self, chat_message)
+
+    async def _cmd_cpu(self, chat_message: Chat_Message) -> None:
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.cpu_message)
+
+    async def _cmd_draw(self, chat_message: Chat_Message) -> None:
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.draw_message)
+
+    async def _cmd_eval(self, chat_message: Chat_Message) -> None:
+        await self._send_last_message(chat_message.room)
+
+    async def _cmd_motor(self, chat_message: Chat_Message) -> None:
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.lichess_game.engine.name)
+
+    async def _cmd_name(self, chat_message: Chat_Message) -> None:
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.name_message)
+
+    async def _cmd_printeval(self, chat_message: Chat_Message) -> None:
+        if chat_message.room in self.print_eval_rooms:
+            return
+        if not self.game_info.increment_ms and self.game_info.initial_time_ms < 180_000:
+            await self._send_last_message(chat_message.room)
+            return
+        self.print_eval_rooms.add(chat_message.room)
+        await self.api.send_chat_message(self.game_info.id_,
+                                         chat_message.room,
+                                         'Type !quiet to stop eval printing.')
+        await self._send_last_message(chat_message.room)
+
+    async def _cmd_quiet(self, chat_message: Chat_Message) -> None:
+        self.print_eval_rooms.discard(chat_message.room)
+
+    async def _cmd_pv(self, chat_message: Chat_Message) -> None:
+        if chat_message.room == 'player':
+            return
+        if not (message := self._append_pv()):
+            message = 'No modules available.'
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, message)
+
+    async def _cmd_ram(self, chat_message: Chat_Message) -> None:
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, self.ram_message)
+
+    async def _cmd_roast(self, chat_message: Chat_Message) -> None:
+        roast = self._get_random_roast()
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, roast)
+
+    async def _cmd_destroy(self, chat_message: Chat_Message) -> None:
+        destroy = self._get_random_destroy()
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, destroy)
+
+    async def _cmd_quotes(self, chat_message: Chat_Message) -> None:
+        quote = self._get_random_quote()
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, quote)
+
+    async def _cmd_help(self, chat_message: Chat_Message) -> None:
+        message = self._HELP_PLAYER if chat_message.room == 'player' else self._HELP_SPECTATOR
+        await self.api.send_chat_message(self.game_info.id_, chat_message.room, message)
+
+    _COMMAND_TABLE: dict[str, Callable[['Chatter', Chat_Message], Awaitable[None]]] = {
+        'cpu': _cmd_cpu,
+        'draw': _cmd_draw,
+        'eval': _cmd_eval,
+        'motor': _cmd_motor,
+        'name': _cmd_name,
+        'printeval': _cmd_printeval,
+        'quiet': _cmd_quiet,
+        'pv': _cmd_pv,
+        'ram': _cmd_ram,
+        'roast': _cmd_roast,
+        'destroy': _cmd_destroy,
+        'troll': _cmd_destroy,
+        'quotes': _cmd_quotes,
+        'help': _cmd_help,
+        'commands': _cmd_help,
+    }
 
     async def _send_last_message(self, room: str) -> None:
         last_message = self.lichess_game.last_message.replace('Engine', 'Evaluation')
-        last_message = ' '.join(last_message.split())
+        last_message = _WHITESPACE_REGEX.sub(' ', last_message).strip()
         if room == 'spectator':
             last_message = self._append_pv(last_message)
         await self.api.send_chat_message(self.game_info.id_, room, last_message)
 
-    def _get_cpu(self) -> str:
-        cpu = ''
-        if os.path.exists('/proc/cpuinfo'):
-            with open('/proc/cpuinfo', encoding='utf-8') as cpuinfo:
-                while line := cpuinfo.readline():
-                    if line.startswith('model name'):
-                        cpu = line.split(': ')[1]
-                        cpu = cpu.replace('(R)', '').replace('(TM)', '')
-                        if len(cpu.split()) > 1:
-                            return cpu
-        if processor := platform.processor():
-            cpu = processor.split()[0].replace('GenuineIntel', 'Intel')
-        cores = psutil.cpu_count(logical=False)
-        threads = psutil.cpu_count(logical=True)
-        cpu_freq = psutil.cpu_freq().max / 1000
-        return f'{cpu} {cores}c/{threads}t @ {cpu_freq:.2f}GHz'
-
-    def _get_ram(self) -> str:
-        mem_bytes = psutil.virtual_memory().total
-        mem_gib = mem_bytes / (1024.**3)
-        return f'{mem_gib:.1f} GiB'
-
-    def _get_draw_message(self, config: Config) -> str:
-        if not config.offer_draw.enabled:
+    @cached_property
+    def draw_message(self) -> str:
+        if not self.config.offer_draw.enabled:
             return 'I will neither accept nor offer draws.'
-        max_score = config.offer_draw.score / 100
-        return (f'I will accept/offer draws after move {config.offer_draw.min_game_length} '
+        max_score = self.config.offer_draw.score / 100
+        return (f'I will accept/offer draws after move {self.config.offer_draw.min_game_length} '
                 f'if the eval is within +{max_score:.2f} to -{max_score:.2f} for the last '
-                f'{config.offer_draw.consecutive_moves} moves.')
+                f'{self.config.offer_draw.consecutive_moves} moves.')
 
-    def _get_name_message(self, version: str) -> str:
-        return f'I am CB-BB, and I use {self.lichess_game.engine.name} (BotLi {version})'
+    @cached_property
+    def name_message(self) -> str:
+        return f'I am CB-BB, and I use {self.lichess_game.engine.name} (BotLi {self.config.version})'
 
     def _format_message(self, message: str | None) -> str | None:
-        if not message:
-            return
-        opponent_username = self.game_info.black_name if self.lichess_game.is_white else self.game_info.white_name
-        mapping = defaultdict(str, {'opponent': opponent_username, 'me': self.username,
-                                    'engine': self.lichess_game.engine.name, 'cpu': self.cpu_message,
-                                    'ram': self.ram_message})
-        return message.format_map(mapping)
+        return message.format_map(self._format_mapping) if message else None
 
     def _append_pv(self, initial_message: str = '') -> str:
         if len(self.lichess_game.last_pv) < 2:
             return initial_message
         if initial_message:
             initial_message += ' '
-        if self.lichess_game.is_our_turn:
-            board = self.lichess_game.board.copy(stack=1)
-            board.pop()
-        else:
-            board = self.lichess_game.board.copy(stack=False)
-        if board.turn:
-            initial_message += 'PV:'
-        else:
-            initial_message += f'PV: {board.fullmove_number}...'
-        final_message = initial_message
-        for move in self.lichess_game.last_pv[1:]:
-            if board.turn:
-                initial_message += f' {board.fullmove_number}.'
-            initial_message += f' {board.san(move)}'
-            if len(initial_message) > 140:
-                break
-            board.push(move)
-            final_message = initial_message
-        return final_message
+        board = self.lichess_game.board
+        our_move = board.pop() if self.lichess_game.is_our_turn else None
+        pushed_moves = 0
+        try:
+            turn = board.turn
+            fullmove_number = board.fullmove_number
+            parts = [initial_message, 'PV:' if turn else f'PV: {fullmove_number}...']
+            length = len(parts[0]) + len(parts[1])
+            for move in self.lichess_game.last_pv[1:]:
+                part = f' {fullmove_number}. {board.san(move)}' if turn else f' {board.san(move)}'
+                length += len(part)
+                if length > 140:
+                    break
+                board.push(move)
+                pushed_moves += 1
+                parts.append(part)
+                if not turn:
+                    fullmove_number += 1
+                turn = not turn
+            return ''.join(parts)
+        finally:
+            for _ in range(pushed_moves):
+                board.pop()
+            if our_move is not None:
+                board.push(our_move)
 
     def _get_random_roast(self) -> str:
-        roasts = [
-            "You play like your pieces are allergic to the center.",
-            "Your strategy is so deep, it hasn't surfaced yet.",
-            "I’ve seen pawns with more ambition than your whole army.",
-            "You're like a blunder wrapped in an inaccuracy.",
-            "Even Stockfish ran out of evals trying to explain your moves.",
-            "You treat the king like a tourist — always wandering.",
-            "You play like your mouse is on strike.",
-        ]
-        return random.choice(roasts)
+        return self._rng.choice(_ROASTS)
 
     def _get_random_destroy(self) -> str:
-        destroys = [
-            "I’m not just winning — I’m rewriting your opening book in real time.",
-            "This isn’t a game anymore. It’s a live demo of how to dismantle a player.",
-            "You're not losing, you're being systematically erased.",
-            "Your board is starting to look like a clearance sale — everything must go!",
-            "If this were a movie, you'd already be rolling the credits.",
-            "You brought a pawn to a queen fight.",
-            "This isn't just checkmate — it's checkmate with style.",
-        ]
-        return random.choice(destroys)
+        return self._rng.choice(_DESTROYS)
 
     def _get_random_quote(self) -> str:
-        quotes = [
-            "“In life, as in chess, forethought wins.” – Charles Buxton",
-            "“Even a poor plan is better than no plan at all.” – Mikhail Chigorin",
-            "“Every master was once a beginner.”",
-            "“Play the opening like a book, the middlegame like a magician, and the endgame like a machine.” – Rudolf Spielmann",
-            "“The blunders are all there on the board, waiting to be made.” – Savielly Tartakower",
-            "“You must take your opponent into a deep dark forest where 2+2=5, and the path leading out is only wide enough for one.” – Tal",
-            "“Great moves often come from great pain.”",
-            "“The beauty of a move lies not in its appearance but in the thought behind it.” – Aaron Nimzowitsch",
-        ]
-        return random.choice(quotes)
+        return self._rng.choice(_QUOTES)